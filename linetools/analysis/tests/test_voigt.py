@@ -97,6 +97,60 @@ def test_voigt_sngl_tau():
     np.testing.assert_allclose(tau[imn], 2.9681283001576779)
 
 
+def _example_line_pars(nlines=5):
+    """ cgs parameter array of HI Lya-like lines, shape (6, nlines) """
+    pars = np.empty((6, nlines))
+    pars[0] = np.linspace(13.5, 14.5, nlines)      # logN
+    pars[1] = np.linspace(1.999, 2.001, nlines)    # z
+    pars[2] = np.linspace(15., 30., nlines) * 1e5  # b (cm/s)
+    pars[3] = 1215.670e-8                          # wrest (cm)
+    pars[4] = 0.4164                               # f
+    pars[5] = 6.265e8                              # gamma (s^-1)
+    return pars
+
+
+def test_voigt_tau_lines():
+    # Wavelength array (cm)
+    wave = np.linspace(3644, 3650, 100) * 1e-8
+    pars = _example_line_pars()
+    tau = lav.voigt_tau_lines(wave, pars)
+    # Must match the per-line evaluation
+    tau_sum = np.sum([lav.voigt_tau(wave, pars[:, jj])
+                      for jj in range(pars.shape[1])], axis=0)
+    np.testing.assert_allclose(tau, tau_sum)
+
+
+def test_voigt_tau_lines_chunked(monkeypatch):
+    # Force nlines > nchunk to exercise the chunked loop over lines
+    monkeypatch.setattr(lav, '_WOFZ_CHUNK', 200)
+    wave = np.linspace(3644, 3650, 100) * 1e-8
+    pars = _example_line_pars()
+    tau = lav.voigt_tau_lines(wave, pars)
+    tau_sum = np.sum([lav.voigt_tau(wave, pars[:, jj])
+                      for jj in range(pars.shape[1])], axis=0)
+    np.testing.assert_allclose(tau, tau_sum)
+
+
+def test_voigt_tau_lines_numba():
+    pytest.importorskip('numba')
+    wave = np.linspace(3644, 3650, 100) * 1e-8
+    pars = _example_line_pars()
+    tau = lav.voigt_tau_lines(wave, pars)
+    tau_numba = lav.voigt_tau_lines(wave, pars, use_numba=True)
+    # The Humlicek W4 kernel is good to ~1e-4
+    np.testing.assert_allclose(tau_numba, tau, rtol=1e-3)
+
+
+def test_voigt_tau_lines_numba_fallback(monkeypatch):
+    # use_numba=True must silently fall back to the exact path
+    # when numba is not installed
+    monkeypatch.setattr(lav, '_HAS_NUMBA', False)
+    wave = np.linspace(3644, 3650, 100) * 1e-8
+    pars = _example_line_pars()
+    tau = lav.voigt_tau_lines(wave, pars, use_numba=True)
+    np.testing.assert_allclose(tau, lav.voigt_tau_lines(wave, pars))
+
+
 def test_voigt_king():
     vin = np.linspace(0., 1., num=1000)
     a = 0.1
@@ -17,12 +17,64 @@ from astropy.modeling import FittableModel, Parameter
 
 from linetools.spectra.xspectrum1d import XSpectrum1D
 from linetools.spectralline import AbsLine
-from linetools.spectra import convolve as lsc
 
 #from xastropy.xutils import xdebug as xdb
 
 c_cgs = 29979245800.0  # cm/s
 
+# Bound on the size (nwave * nlines) of the work arrays chunked over
+# in voigt_tau_lines
+_WOFZ_CHUNK = int(1e7)
+
+# Optional numba acceleration of the summed-Voigt kernel
+try:
+    from numba import njit, prange
+except ImportError:
+    _HAS_NUMBA = False
+else:
+    _HAS_NUMBA = True
+
+    @njit(cache=True)
+    def _humlicek_w4(x, a):
+        """ Real part of the Faddeeva function via the Humlicek (1982)
+        W4 rational approximation (relative accuracy ~1e-4).
+        """
+        t = complex(a, -x)
+        s = abs(x) + a
+        if s >= 15.0:
+            # Region I
+            w = t * 0.5641896 / (0.5 + t * t)
+        elif s >= 5.5:
+            # Region II
+            uu = t * t
+            w = t * (1.410474 + uu * 0.5641896) / (0.75 + uu * (3.0 + uu))
+        elif a >= 0.195 * abs(x) - 0.176:
+            # Region III
+            w = (16.4955 + t * (20.20933 + t * (11.96482 +
+                 t * (3.778987 + t * 0.5642236)))) / \
+                (16.4955 + t * (38.82363 + t * (39.27121 +
+                 t * (21.69274 + t * (6.699398 + t)))))
+        else:
+            # Region IV
+            uu = t * t
+            w = np.exp(uu) - t * (36183.31 - uu * (3321.9905 -
+                uu * (1540.787 - uu * (219.0313 - uu * (35.76683 -
+                uu * (1.320522 - uu * 0.56419)))))) / \
+                (32066.6 - uu * (24322.84 - uu * (9022.228 -
+                uu * (2186.181 - uu * (364.2191 - uu * (61.57037 -
+                uu * (1.841439 - uu)))))))
+        return w.real
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _voigt_sum(nu_wave, zp1, nujk, dnu, avoigt, cne, tau):
+        """ Sum tau over all lines, parallel over wavelength pixels """
+        for ii in prange(nu_wave.size):
+            isum = 0.
+            for jj in range(zp1.size):
+                uvoigt = (nu_wave[ii] * zp1[jj] - nujk[jj]) / dnu[jj]
+                isum += cne[jj] * _humlicek_w4(uvoigt, avoigt[jj]) / dnu[jj]
+            tau[ii] = isum
+
 
 def voigt_wofz(vin,a):
     """Uses scipy function for calculation.
@@ -121,9 +173,68 @@ def voigt_tau(wave, par):
     return tau
 
 
+def voigt_tau_lines(wave, pars, use_numba=False):
+    """ Sum the optical depth of many lines at the input wavelengths
+
+    Vectorized analog of voigt_tau.  All of the lines are evaluated
+    with a single (chunked) call into scipy.special.wofz instead of
+    one call per line, which is considerably faster for many lines.
+    As with voigt_tau, the inputs are unitless cgs.
+
+    Parameters
+    ----------
+    wave : ndarray
+      Assumed to be in cm
+    pars : ndarray, shape (6, nlines)
+      Line parameters, one column per line, ordered as in voigt_tau
+        pars[0] = logN (cm^-2)
+        pars[1] = z
+        pars[2] = b in cm/s
+        pars[3] = wrest in cm
+        pars[4] = f value
+        pars[5] = gamma (s^-1)
+    use_numba : bool, optional [False]
+      If True and numba is installed, evaluate with a jit-compiled
+      kernel (Humlicek W4 approximation, parallel over pixels).
+      This is ~1e-4 accurate, i.e. fine for display purposes but
+      not for fitting.
+
+    Returns
+    -------
+    tau : ndarray
+      Summed optical depth at input wavelengths
+    """
+    cold = 10.0**pars[0]
+    zp1 = pars[1] + 1.0
+    nujk = c_cgs / pars[3]
+    dnu = pars[2] / pars[3]
+    avoigt = pars[5] / (4 * np.pi * dnu)
+    cne = 0.014971475 * cold * pars[4]
+
+    nu_wave = c_cgs / wave
+    tau = np.zeros(wave.size)
+
+    # Numba kernel, if requested and available
+    if use_numba and _HAS_NUMBA:
+        _voigt_sum(nu_wave, zp1, nujk, dnu, avoigt, cne, tau)
+        return tau
+
+    # Chunk over lines to bound the (nwave, nlines) work arrays
+    nlines = pars.shape[1]
+    nchunk = max(1, _WOFZ_CHUNK // wave.size)
+    for ii in range(0, nlines, nchunk):
+        jj = ii + nchunk
+        uvoigt = (nu_wave[:, None] * zp1[ii:jj] - nujk[ii:jj]) / dnu[ii:jj]
+        # One Faddeeva evaluation for the whole chunk
+        wofzr = wofz(uvoigt + 1j * avoigt[ii:jj]).real
+        tau += np.dot(wofzr, cne[ii:jj] / dnu[ii:jj])
+    #
+    return tau
+
+
 # The primary call
 def voigt_from_abslines(iwave, line, fwhm=None, ret=['vmodel'],
-                        skip_wveval=False, debug=False):
+                        skip_wveval=False, use_numba=False, debug=False):
     """ Generates a Voigt model from a line or list of AbsLines
 
     This may run *slowly* for many many lines.
@@ -150,6 +261,9 @@ def voigt_from_abslines(iwave, line, fwhm=None, ret=['vmodel'],
       1/10 of the b-value of the input line(s).  
       If necessary, the wavelenght array is rebinned for the calculation
       and the final array is rebinned to the original.
+    use_numba : bool, optional [False]
+      Passed to voigt_tau_lines;  use the approximate jit-compiled
+      kernel if numba is installed (display quality only).
     debug : bool, optional
 
     Returns
@@ -201,10 +315,10 @@ def voigt_from_abslines(iwave, line, fwhm=None, ret=['vmodel'],
     else: 
         raise IOError('voigt_from_abslines: Unknown input')
 
-    # Generate tau 
-    tau = np.zeros(wave.size)
+    # Generate tau -- gather the line parameters and evaluate in one batch
     wavecm = wave.to('cm').value
-    for iline in lines:
+    pars = np.empty((6, len(lines)))
+    for jj, iline in enumerate(lines):
         if not isinstance(iline.attrib['N'], u.Quantity):
             # assume km/s
             raise RuntimeError("line attribute 'N' must have units!")
@@ -212,11 +326,11 @@ def voigt_from_abslines(iwave, line, fwhm=None, ret=['vmodel'],
             print(iline, iline.attrib['N'])
         if iline.attrib['b'].value <= 0.:
             raise RuntimeError("line attribute 'b' must have units and be positive!")
-        par = [np.log10(iline.attrib['N'].value),
-               iline.z, iline.attrib['b'].to('cm/s').value,
-               iline.wrest.to('cm').value, iline.data['f'],
-               iline.data['gamma'].value]
-        tau += voigt_tau(wavecm, par)
+        pars[:, jj] = [np.log10(iline.attrib['N'].value),
+                       iline.z, iline.attrib['b'].to('cm/s').value,
+                       iline.wrest.to('cm').value, iline.data['f'],
+                       iline.data['gamma'].value]
+    tau = voigt_tau_lines(wavecm, pars, use_numba=use_numba)
 
     # Only tau?
     if ret == 'tau':
@@ -323,5 +437,6 @@ class single_voigt_model(FittableModel):
         tau = voigt_tau(wave/1e8, [logN,z,b*1e5,wrest/1e8,f,gamma])
         fx = np.exp(-1*tau)
         if fwhm > 0.:
+            from linetools.spectra import convolve as lsc
             fx = lsc.convolve_psf(fx, fwhm)
-        return fx 
+        return fx
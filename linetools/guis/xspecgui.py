@@ -21,10 +21,6 @@ from linetools.guis import line_widgets as ltgl
 from linetools.guis import spec_widgets as ltgsp
 
 from linetools import utils as ltu
-from linetools.analysis import voigt as lav
-from linetools.isgm.abscomponent import AbsComponent
-from linetools.isgm import utils as ltiu
-from linetools.lists.linelist import LineList
 
 
 
@@ -86,6 +82,13 @@ class XSpecGui(QMainWindow):
         abs_sys = None
         voigtsfit = None
         if guessfile is not None:
+            # Deferred imports -- this chain (Voigt analysis, isgm,
+            # line lists) dominates the GUI cold start and is only
+            # needed when a guessfile is supplied
+            from linetools.analysis import voigt as lav
+            from linetools.isgm.abscomponent import AbsComponent
+            from linetools.isgm import utils as ltiu
+            from linetools.lists.linelist import LineList
             # Load
             ism = LineList('ISM')
             igm_guess = ltu.loadjson(guessfile)
@@ -101,13 +104,20 @@ class XSpecGui(QMainWindow):
             spec, spec_fil = ltgu.read_spec(ispec, exten=exten, norm=norm,
                                             rsp_kwargs=rsp_kwargs)
 
-            voigtsfit = np.asarray([0] * len(spec.wavelength))
+            voigtsfit = np.zeros(spec.wavelength.size)
             alllines = []
             for iabs_sys in abs_sys:
-                lines = iabs_sys.list_of_abslines()
-                alllines = alllines + lines
+                for iline in iabs_sys.list_of_abslines():
+                    # Filter up front so the Voigt kernel only sees
+                    # usable lines
+                    if iline.analy['do_analysis'] == 0:
+                        continue
+                    if iline.attrib['b'].value <= 0.:
+                        continue
+                    alllines.append(iline)
             if len(alllines) > 0:
-                voigtsfit = lav.voigt_from_abslines(spec.wavelength, alllines, fwhm=3.).flux.value
+                voigtsfit = lav.voigt_from_abslines(spec.wavelength, alllines,
+                                                    fwhm=3., use_numba=True).flux.value
 
             if not norm:
                 voigtsfit = voigtsfit * spec.co
@@ -179,11 +189,12 @@ class XSpecGui(QMainWindow):
         if event.button == 3: # Set redshift
             if event.xdata is None:  # Mac bug [I think]
                 return
-            if self.pltline_widg.llist['List'] is None:
+            llist = self.pltline_widg.llist
+            if llist['List'] is None:
                 return
+            llist_data = llist[llist['List']]._data
             self.select_line_widg = ltgl.SelectLineWidget(
-                self.pltline_widg.llist[self.pltline_widg.llist['List']]._data,
-                scale=self.scale)
+                llist_data, scale=self.scale)
             self.select_line_widg.exec_()
             line = self.select_line_widg.line
             if line.strip() == 'None':
@@ -194,14 +205,14 @@ class XSpecGui(QMainWindow):
             #QtCore.pyqtRemoveInputHook()
             #pdb.set_trace()
             #QtCore.pyqtRestoreInputHook()
-            wrest = Quantity(float(spltw[0]), unit=self.pltline_widg.llist[
-                self.pltline_widg.llist['List']]._data['wrest'].unit) # spltw[1])  [A bit risky!]
+            wrest = Quantity(float(spltw[0]),
+                             unit=llist_data['wrest'].unit) # spltw[1])  [A bit risky!]
             z = event.xdata/wrest.value - 1.
-            self.pltline_widg.llist['z'] = z
+            llist['z'] = z
             print("z={:.5f}".format(z))
             self.statusBar().showMessage('z = {:f}'.format(z))
 
-            self.pltline_widg.zbox.setText('{:.5f}'.format(self.pltline_widg.llist['z']))
+            self.pltline_widg.zbox.setText('{:.5f}'.format(llist['z']))
 
             # Draw
             self.spec_widg.on_draw()
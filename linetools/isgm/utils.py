@@ -1027,7 +1027,7 @@ def unique_components(comps1, comps2, tol=5*u.arcsec):
 
     """
     c_mks = const.c.to('km/s').value
-    unique = np.array([True]*len(comps1))
+    unique = np.ones(len(comps1), dtype=bool)
     # Coordinates
     ras = [icomp.coord.ra.value for icomp in comps1]
     decs = [icomp.coord.dec.value for icomp in comps1]
@@ -655,7 +655,7 @@ class LSF(object):
                 import matplotlib.pyplot as plt
                 plt.plot(wv_array_AA, lsf_vals, 'k-')
                 # import pdb; pdb.set_trace()
-            lsf_vals = np.where(lsf_vals < 0, 0., lsf_vals)
+            np.clip(lsf_vals, 0., None, out=lsf_vals)
 
         # normalize
         lsf_vals /= np.sum(lsf_vals)
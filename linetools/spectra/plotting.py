@@ -12,8 +12,45 @@ def get_flux_plotrange(fl, perc=95, mult_pos=1.5, mult_neg=-0.1):
     else:
         fl = np.array(fl, copy=True)
 
-    try: 
+    try:
         ymax = abs(np.percentile(fl[~np.isnan(fl)], perc)) * mult_pos
     except:
         import pdb; pdb.set_trace()
     return mult_neg * ymax, ymax
+
+
+def get_envelope_indices(fl, npts=10000):
+    """ Indices of a min/max envelope for decimated plotting.
+
+    The array is split into ~npts equal bins and the positions of the
+    minimum and maximum of each bin are returned in index order, so
+    fl[indices] traces the visual envelope of the full-resolution
+    array with ~2*npts points.
+
+    Parameters
+    ----------
+    fl : ndarray
+    npts : int, optional
+      Approximate number of bins
+
+    Returns
+    -------
+    indices : ndarray of int
+    """
+    if isinstance(fl, Quantity):
+        fl = fl.value
+    binsz = fl.size // npts
+    if binsz < 3:
+        # With fewer than 3 pixels per bin the min/max pair is the
+        # whole bin, i.e. the identity -- do not bother
+        return np.arange(fl.size)
+    nbin = fl.size // binsz
+    fl2 = np.reshape(fl[:nbin * binsz], (nbin, binsz))
+    imin = np.argmin(fl2, axis=1)
+    imax = np.argmax(fl2, axis=1)
+    row0 = np.arange(nbin) * binsz
+    indices = np.empty(2 * nbin, dtype=int)
+    indices[0::2] = row0 + np.minimum(imin, imax)
+    indices[1::2] = row0 + np.maximum(imin, imax)
+    # Keep any pixels beyond the last full bin
+    return np.concatenate([indices, np.arange(nbin * binsz, fl.size)])
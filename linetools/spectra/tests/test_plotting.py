@@ -7,7 +7,7 @@ from astropy import units as u
 import numpy as np
 from astropy.io import fits
 
-from linetools.spectra.plotting import get_flux_plotrange
+from linetools.spectra.plotting import get_flux_plotrange, get_envelope_indices
 
 def test_get_flux_plotrange():
     flux = [1, 2, 0.5, np.nan, 0.7, 1.1]
@@ -15,3 +15,28 @@ def test_get_flux_plotrange():
     ref = -0.273, 2.73
     np.testing.assert_allclose(get_flux_plotrange(flux), ref)
     np.testing.assert_allclose(get_flux_plotrange(qflux), ref)
+
+
+def test_get_envelope_indices():
+    rstate = np.random.RandomState(10)
+    fl = rstate.rand(100003)
+    npts = 10000
+    indices = get_envelope_indices(fl, npts=npts)
+    # Ordered, with the tail pixels beyond the last full bin kept
+    assert np.all(np.diff(indices) > 0)
+    assert indices[-1] == fl.size - 1
+    binsz = fl.size // npts
+    nbin = fl.size // binsz
+    assert indices.size == 2 * nbin + (fl.size - nbin * binsz)
+    # Each bin contributes its min and max
+    env = fl[indices[:2 * nbin]].reshape(nbin, 2)
+    fl2 = fl[:nbin * binsz].reshape(nbin, binsz)
+    np.testing.assert_allclose(env.min(axis=1), fl2.min(axis=1))
+    np.testing.assert_allclose(env.max(axis=1), fl2.max(axis=1))
+    # Quantity input
+    indices2 = get_envelope_indices(fl * u.ct, npts=npts)
+    assert np.array_equal(indices2, indices)
+    # binsz < 3 is the identity, so decimation is skipped
+    for size in (5000, 25000):
+        indices3 = get_envelope_indices(fl[:size], npts=npts)
+        assert np.array_equal(indices3, np.arange(size))
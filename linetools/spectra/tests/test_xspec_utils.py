@@ -99,6 +99,26 @@ def test_rebin(specr, specmr):
     np.testing.assert_allclose(spec2.wvmax.value, 8995.0)
 
 
+def test_rebin_edges_cache(specr):
+    # The memoized edge arrays are read-only, so a cache hit cannot
+    # hand out an array an earlier caller has modified
+    wave_bytes = np.asarray(specr.wavelength.value, dtype=np.float64).tobytes()
+    wvh, dwv = ltsu._rebin_edges(wave_bytes)
+    assert not wvh.flags.writeable
+    assert not dwv.flags.writeable
+    wvh2, _ = ltsu._rebin_edges(wave_bytes)
+    assert wvh2 is wvh  # Cache hit
+    new_wv = np.arange(3000., 9000., 5) * u.AA
+    bwv = ltsu._rebin_new_edges(
+        np.asarray(new_wv.value, dtype=np.float64).tobytes())
+    assert not bwv.flags.writeable
+    # Two successive rebins on the same grids must agree
+    newspec = specr.rebin(new_wv, do_sig=True)
+    newspec2 = specr.rebin(new_wv, do_sig=True)
+    np.testing.assert_allclose(newspec.flux.value, newspec2.flux.value)
+    np.testing.assert_allclose(newspec.sig.value, newspec2.sig.value)
+
+
 def test_addnoise(spec):
     #
     newspec = spec.add_noise(seed=12)
@@ -153,6 +173,21 @@ def test_rebintwo(specr):
     assert newspec.sig_is_set is False
 
 
+def test_rebin_beyond_edge(specr):
+    # New grid overhanging the input one;  the cumulative sum is
+    # clamped at the red edge, so the last overlapping pixel holds
+    # only the flux actually covered and the overhang rebins to zero
+    new_wv = np.arange(3000., 10000., 5) * u.AA
+    newspec = specr.rebin(new_wv, do_sig=True)
+    beyond = newspec.wavelength > specr.wvmax
+    assert np.all(newspec.flux[beyond].value == 0.)
+    assert np.all(newspec.sig[beyond].value == 0.)
+    # Last overlapping pixel -- partial coverage, not a fill artifact
+    iedge = np.where(~beyond)[0][-1]
+    np.testing.assert_allclose(newspec.flux[iedge].value, 0.6466691, rtol=1e-5)
+    assert newspec.sig[iedge].value == 0.  # Edge pixel, not to be trusted
+
+
 def test_relvel(spec):
 
     # Velocity
@@ -8,6 +8,8 @@ import json
 import warnings
 import pdb
 
+from functools import lru_cache
+
 from astropy import units as u
 from astropy import constants as const
 
@@ -87,23 +89,28 @@ def splice_two(spec1, spec2, wvmx=None, scale=1., chk_units=True):
     if wvmx is None:
         wvmx = spec1.wvmax
     #
-    gdp1 = np.where(spec1.wavelength <= wvmx)[0]
-    gdp2 = np.where(spec2.wavelength > wvmx)[0]
+    # Pull the arrays once -- each property access re-compresses the mask
+    wv1 = spec1.wavelength.value
+    wv2 = spec2.wavelength.value
+    wvmx_val = wvmx.to(spec1.units['wave']).value
+    gdp1 = wv1 <= wvmx_val
+    gdp2 = wv2 > wvmx_val
     # Concatenate
-    new_wv = np.concatenate((spec1.wavelength.value[gdp1],
-                             spec2.wavelength.value[gdp2]))
+    new_wv = np.concatenate((wv1[gdp1], wv2[gdp2]))
     uwave = u.Quantity(new_wv, unit=spec1.units['wave'])
     new_fx = np.concatenate((spec1.flux.value[gdp1],
                              spec2.flux.value[gdp2] * scale))
     # Error
     if spec1.sig_is_set:
-        new_sig = np.concatenate((spec1.sig[gdp1], spec2.sig[gdp2] * scale))
+        new_sig = np.concatenate((spec1.sig.value[gdp1],
+                                  spec2.sig.value[gdp2] * scale))
     else:
         new_sig = None
 
     # Continuum
     if spec1.co_is_set:
-        new_co = np.concatenate((spec1.co[gdp1], spec2.co[gdp2] * scale))
+        new_co = np.concatenate((spec1.co.value[gdp1],
+                                 spec2.co.value[gdp2] * scale))
     else:
         new_co = None
 
@@ -194,6 +201,64 @@ def collate(spectra, **kwargs):
     return new_spec
 
 
+@lru_cache(maxsize=16)
+def _rebin_edges(wave_bytes):
+    """ Pixel edges and widths for a wavelength grid
+
+    Memoized on the raw bytes of the (float64) wavelength array, since
+    GUI redraws and model fitting rebin many spectra sharing a grid.
+
+    Parameters
+    ----------
+    wave_bytes : bytes
+      From wave.tobytes()
+
+    Returns
+    -------
+    wvh : ndarray
+      Pixel upper edges
+    dwv : ndarray
+      Pixel widths
+    """
+    wave = np.frombuffer(wave_bytes)
+    wvh = np.empty_like(wave)
+    wvh[:-1] = (wave[:-1] + wave[1:]) / 2.
+    wvh[-1] = wave[-1] + (wave[-1] - wave[-2]) / 2.
+    dwv = np.empty_like(wvh)
+    dwv[1:] = wvh[1:] - wvh[:-1]
+    dwv[0] = 2 * (wvh[0] - wave[0])
+    # Guard the cache -- callers must copy before modifying
+    wvh.setflags(write=False)
+    dwv.setflags(write=False)
+    return wvh, dwv
+
+
+@lru_cache(maxsize=16)
+def _rebin_new_edges(wave_bytes):
+    """ Pixel edges for a new wavelength grid, padded at the start
+
+    Memoized as in _rebin_edges.
+
+    Parameters
+    ----------
+    wave_bytes : bytes
+      From new_wv.tobytes()
+
+    Returns
+    -------
+    bwv : ndarray
+      Pixel edges;  one element longer than the grid
+    """
+    wave = np.frombuffer(wave_bytes)
+    bwv = np.empty(wave.size + 1)
+    bwv[0] = wave[0] - (wave[1] - wave[0]) / 2.
+    bwv[1:-1] = (wave[:-1] + wave[1:]) / 2.
+    bwv[-1] = wave[-1] + (wave[-1] - wave[-2]) / 2.
+    # Guard the cache -- callers must copy before modifying
+    bwv.setflags(write=False)
+    return bwv
+
+
 def rebin(spec, new_wv, do_sig=False, do_co=False, all=False,
           fill_value=0., grow_bad_sig=False, **kwargs):
     """ Rebin a single spectrum in an XSpectrum1D object to a new wavelength array
@@ -212,7 +277,8 @@ def rebin(spec, new_wv, do_sig=False, do_co=False, all=False,
     new_wv : Quantity array
       New wavelength array
     fill_value : float, optional
-      Fill value at the edges
+      Fill value for the cumulative sum blueward of the input grid;
+      redward it is continued at its final value.
       Default = 0., but 'extrapolate' may be considered
     do_sig : bool, optional
       Rebin error too (if it exists).
@@ -231,7 +297,6 @@ def rebin(spec, new_wv, do_sig=False, do_co=False, all=False,
       XSpectrum1D of the rebinned spectrum
     """
     from linetools.spectra.xspectrum1d import XSpectrum1D
-    from scipy.interpolate import interp1d
     # Save flux info to avoid unit issues
     funit = spec.flux.unit
     flux = spec.flux.value
@@ -253,13 +318,11 @@ def rebin(spec, new_wv, do_sig=False, do_co=False, all=False,
         bads = np.any([np.isnan(sig[gdf]), np.isinf(sig[gdf]**2)], axis=0)  # Latter is for way too large values
         bad_sig[bads] = True
 
-    # Endpoints of original pixels
-    npix = len(spec.wavelength)
-    wvh = (spec.wavelength + np.roll(spec.wavelength, -1)) / 2.
-    wvh[npix - 1] = spec.wavelength[npix - 1] + \
-                    (spec.wavelength[npix - 1] - spec.wavelength[npix - 2]) / 2.
-    dwv = wvh - np.roll(wvh, 1)
-    dwv[0] = 2 * (wvh[0] - spec.wavelength[0])
+    # Endpoints of original pixels (memoized across calls sharing a grid)
+    wave = spec.wavelength
+    wvh, dwv = _rebin_edges(np.asarray(wave.value, dtype=np.float64).tobytes())
+    wvh = wvh * wave.unit
+    dwv = dwv * wave.unit
     med_dwv = np.median(dwv.value)
 
     wvh = wvh[gdf]
@@ -274,43 +337,39 @@ def rebin(spec, new_wv, do_sig=False, do_co=False, all=False,
     else:
         var = np.ones_like(flux)
 
-    # Cumulative Sum
-    cumsum = np.cumsum(flux * dwv)
-    cumvar = np.cumsum(var * dwv.value, dtype=np.float64)
-
-    # Interpolate (loses the units)
-    fcum = interp1d(wvh, cumsum, fill_value=fill_value, bounds_error=False)
-    fvar = interp1d(wvh, cumvar, fill_value=0., bounds_error=False)
-
-    # Endpoints of new pixels
-    nnew = len(new_wv)
-    nwvh = (new_wv + np.roll(new_wv, -1)) / 2.
-    nwvh[nnew - 1] = new_wv[nnew - 1] + \
-                     (new_wv[nnew - 1] - new_wv[nnew - 2]) / 2.
-    # Pad starting point
-    bwv = np.zeros(nnew + 1) * new_wv.unit
-    bwv[0] = new_wv[0] - (new_wv[1] - new_wv[0]) / 2.
-    bwv[1:] = nwvh
-
-    # Evaluate and put unit back
-    newcum = fcum(bwv) * dwv.unit
-    newvar = fvar(bwv) * dwv.unit
-
-    # Endpoint
-    #if (bwv[-1] > wvh[-1]):
-    #    newcum[-1] = cumsum[-1]
-    #    newvar[-1] = cumvar[-1]
-
-    # Rebinned flux, var, co
-    new_fx = (np.roll(newcum, -1) - newcum)[:-1]
-    new_var = (np.roll(newvar, -1) - newvar)[:-1]
-
-    # Normalize (preserve counts and flambda)
-    new_dwv = bwv - np.roll(bwv, 1)
-    new_fx = new_fx / new_dwv[1:]
+    # Cumulative Sum -- accumulate in place on the product arrays
+    cumsum = flux * dwv
+    np.cumsum(cumsum, out=cumsum)
+    cumvar = np.asarray(var * dwv.value, dtype=np.float64)
+    np.cumsum(cumvar, out=cumvar)
+
+    # Endpoints of new pixels, padded at the starting point
+    bwv = _rebin_new_edges(np.asarray(new_wv.value, dtype=np.float64).tobytes())
+    bwv = bwv * new_wv.unit
+
+    # Interpolate the cumulative sums onto the new edges (loses the
+    # units).  wvh is monotonic so np.interp applies, and its natural
+    # clamping at the right edge continues the cumulative sum, which
+    # removes the old post-hoc endpoint patch;  scipy is kept only for
+    # fill_value='extrapolate'
+    if isinstance(fill_value, basestring):
+        from scipy.interpolate import interp1d
+        fcum = interp1d(wvh, cumsum, fill_value=fill_value, bounds_error=False)
+        newcum = fcum(bwv) * dwv.unit
+    else:
+        newcum = np.interp(bwv.value, wvh.value, cumsum.value,
+                           left=fill_value) * dwv.unit
+    newvar = np.interp(bwv.value, wvh.value, cumvar, left=0.) * dwv.unit
+
+    # Rebinned flux, var, co -- difference the cumulative sums and
+    # normalize in place (preserve counts and flambda)
+    new_dwv = bwv[1:] - bwv[:-1]
+    new_fx = newcum[1:] - newcum[:-1]
+    new_fx /= new_dwv
     # Preserve S/N (crudely)
     med_newdwv = np.median(new_dwv.value)
-    new_var = new_var / (med_newdwv/med_dwv) / new_dwv[1:]
+    new_var = newvar[1:] - newvar[:-1]
+    new_var /= (med_newdwv/med_dwv) * new_dwv
 
     # Return new spectrum
     if do_sig:
@@ -321,8 +380,8 @@ def rebin(spec, new_wv, do_sig=False, do_co=False, all=False,
         # Deal with bad pixels (grow_bad_sig should be True)
         bad = np.where(var <= 0.)[0]
         for ibad in bad:
-            bad_new = np.where(np.abs(new_wv-spec.wavelength[ibad]) <
-                               (new_dwv[1:]+dwv[ibad])/2)[0]
+            bad_new = np.where(np.abs(new_wv-wave[ibad]) <
+                               (new_dwv+dwv[ibad])/2)[0]
             new_sig[bad_new] = 0.
         # Zero out edge pixels -- not to be trusted
         igd = np.where(gd)[0]
@@ -339,11 +398,12 @@ def rebin(spec, new_wv, do_sig=False, do_co=False, all=False,
             raise IOError("Continuum must be set to request rebinning")
         co = spec.co.value
         co = co[gdf]
-        cumco = np.cumsum(co * dwv)
-        fco = interp1d(wvh, cumco, fill_value=0., bounds_error=False)
-        newco = fco(bwv) * dwv.unit
-        new_co = (np.roll(newco, -1) - newco)[:-1]
-        new_co = new_co / new_dwv[1:]
+        cumco = co * dwv
+        np.cumsum(cumco, out=cumco)
+        newco = np.interp(bwv.value, wvh.value, cumco.value,
+                          left=0.) * dwv.unit
+        new_co = newco[1:] - newco[:-1]
+        new_co /= new_dwv
     else:
         new_co = None
 
@@ -16,7 +16,7 @@ from astropy.table import QTable, Column, Table
 
 import linetools.utils as ltu
 
-from .plotting import get_flux_plotrange
+from .plotting import get_flux_plotrange, get_envelope_indices
 from .utils import meta_to_disk
 
 from ..analysis.interactive_plot import InteractiveCoFit
@@ -441,7 +441,7 @@ class XSpectrum1D(object):
         if self.sig_is_set:
             gdpx = self.sig > 0.
         else:
-            gdpx = np.array([True] * self.wavelength.value.size)
+            gdpx = np.ones(self.wavelength.value.size, dtype=bool)
         # Fill in attributes
         self._npix = len(self.data['flux'][self.select].compressed())
         if np.any(gdpx):
@@ -481,15 +481,18 @@ class XSpectrum1D(object):
 
         # Modify the flux
         if s2n is not None:
-            sig = 1. / s2n
+            sig = 1. / np.asarray(s2n)
         else:
             sig = self.sig.value
+        # Perturb in place -- rand is ours, so reuse it as the work buffer
+        np.multiply(rand, sig, out=rand)
+        np.add(rand, self.flux.value, out=rand)
         # Copy
         newspec = self.copy()
         # Deal with mask
         gdp = ~self.data['flux'][self.select].mask
-        newspec.data['flux'][self.select][gdp] = self.flux.value + (rand * sig)
-        newspec.data['sig'][self.select][gdp] = np.ones_like(self.flux) * sig
+        newspec.data['flux'][self.select][gdp] = rand
+        newspec.data['sig'][self.select][gdp] = sig
         #
         return newspec
 
@@ -578,6 +581,12 @@ class XSpectrum1D(object):
             else:
                 raise ValueError('normalize: Continuum needs to be same length as flux array')
         else:
+            # Short-circuit if this continuum is already loaded
+            # (common during GUI redraws)
+            if self.normed and self.co_is_set and np.array_equal(
+                    np.asarray(co, dtype=self.data['co'].dtype.base),
+                    self.data['co'][self.select].compressed()):
+                return
             self.co = co
         self.normed = True
 
@@ -632,8 +641,32 @@ class XSpectrum1D(object):
             wvmnx.to(u.AA)
 
         # Locate the values
-        pixmin = np.argmin(np.fabs(self.wavelength - wvmnx[0]))
-        pixmax = np.argmin(np.fabs(self.wavelength - wvmnx[1]))
+        wave = self.wavelength
+        if isinstance(wvmnx[0], Quantity):
+            wvlims = [wvmnx[0].to(wave.unit).value, wvmnx[1].to(wave.unit).value]
+        else:
+            wvlims = [wvmnx[0], wvmnx[1]]
+        wv = wave.value
+        if wv[0] <= wv[-1] and np.all(wv[1:] >= wv[:-1]):
+            # Sorted wavelengths -- nearest pixels via bisection
+            pixs = []
+            for ipix, val in zip(np.searchsorted(wv, wvlims), wvlims):
+                ipix = min(max(ipix, 1), wv.size - 1)
+                if np.fabs(val - wv[ipix-1]) <= np.fabs(wv[ipix] - val):
+                    pixs.append(ipix - 1)
+                else:
+                    pixs.append(ipix)
+            pixmin, pixmax = pixs
+        else:
+            # Unsorted wavelengths -- brute force.  Squared distance is
+            # branchless (no np.fabs pass) and the buffer is shared
+            # between the two limits
+            dist = wv - wvlims[0]
+            np.square(dist, out=dist)
+            pixmin = np.argmin(dist)
+            np.subtract(wv, wvlims[1], out=dist)
+            np.square(dist, out=dist)
+            pixmax = np.argmin(dist)
 
         gdpix = np.arange(pixmin, pixmax + 1, dtype=int)
 
@@ -707,22 +740,39 @@ class XSpectrum1D(object):
 
         show = kwargs.pop('show', True)
 
+        # Decimate very large spectra to a min/max envelope -- Agg
+        # otherwise rasterizes every vertex
+        wave = self.wavelength
+        flux = self.flux
+        if wave.size > 20000:
+            idx = get_envelope_indices(flux)
+            wave = wave[idx]
+            flux = flux[idx]
+        else:
+            idx = None
+
         if nocolor:
             kwargs.update(color='0.5')
-        artists['fl'] = ax.plot(self.wavelength, self.flux,
+        artists['fl'] = ax.plot(wave, flux,
                                 drawstyle='steps-mid', label='1', **kwargs)[0]
 
         # Error
         if nocolor:
             kwargs.update(color='g')
         if self.sig_is_set:
-            ax.plot(self.wavelength, self.sig, **kwargs)
+            sig = self.sig
+            if idx is not None:
+                sig = sig[idx]
+            ax.plot(wave, sig, **kwargs)
 
         # Continuum
         if self.co_is_set and (not self.normed):
             if nocolor:
                 kwargs.update(color='r')
-            ax.plot(self.wavelength, self.co, **kwargs)
+            co = self.co
+            if idx is not None:
+                co = co[idx]
+            ax.plot(wave, co, **kwargs)
 
         # Second spectrum
         if xspec2 is not None:
@@ -754,7 +804,7 @@ class XSpectrum1D(object):
             # Need to save this as an attribute so it doesn't get
             # garbage-collected.
             self._plotter = PlotWrapNav(
-                fig, ax, self.wavelength, self.flux, artists, printhelp=False,
+                fig, ax, wave, flux, artists, printhelp=False,
                 xlim=(xmin, xmax))
 
             if show:
@@ -851,16 +901,23 @@ class XSpectrum1D(object):
           Has the same number of pixels as the original
         """
         if preserve:
-            from astropy.convolution import convolve, Box1DKernel
-            new_fx = convolve(self.flux, Box1DKernel(nbox), **kwargs)
+            from astropy.convolution import convolve, convolve_fft, Box1DKernel
+            # Direct convolution is O(npix*nbox);  go through the FFT
+            # for wide boxcars
+            if nbox > 100:
+                conv = convolve_fft
+            else:
+                conv = convolve
+            kernel = Box1DKernel(nbox)
+            new_fx = conv(self.flux, kernel, **kwargs)
             if self.sig_is_set:
-                new_sig = convolve(self.sig, Box1DKernel(nbox), **kwargs)
+                new_sig = conv(self.sig, kernel, **kwargs)
                 if scale_sig:
                     new_sig /= np.sqrt(nbox)
             else:
                 new_sig = None
             if self.co_is_set:
-                new_co = convolve(self.co, Box1DKernel(nbox), **kwargs)
+                new_co = conv(self.co, kernel, **kwargs)
             else:
                 new_co = None
             new_wv = self.wavelength
@@ -948,7 +1005,7 @@ class XSpectrum1D(object):
         shiftivar = shiftarr.copy()
         shiftindex = shiftarr.copy()
         indexarr = np.arange(self.npix)
-        indnorm = np.outer(indexarr, (np.zeros(2*halfwindow+1)+1))
+        indnorm = np.outer(indexarr, np.ones(2*halfwindow+1))
 
         for i in range(-halfwindow, halfwindow+1):
             shiftarr[:, i+halfwindow] = np.roll(self.flux, i)
@@ -1163,8 +1220,8 @@ class XSpectrum1D(object):
             #prihdu = fits.PrimaryHDU(self.data[self.select]['flux'])
         else:
             prihdu = fits.PrimaryHDU(self.data['flux'].filled(fill_val))
-        hdu = fits.HDUList([prihdu])
         prihdu.name = 'FLUX'
+        hdus = [prihdu]
 
         # Error  (packing LowRedux style)
         if self.sig_is_set:
@@ -1173,7 +1230,7 @@ class XSpectrum1D(object):
             else:
                 sighdu = fits.ImageHDU(self.data['sig'].filled(fill_val))
             sighdu.name = 'ERROR'
-            hdu.append(sighdu)
+            hdus.append(sighdu)
 
         # Wavelength
         if select:
@@ -1181,7 +1238,7 @@ class XSpectrum1D(object):
         else:
             wvhdu = fits.ImageHDU(self.data['wave'].filled(fill_val))
         wvhdu.name = 'WAVELENGTH'
-        hdu.append(wvhdu)
+        hdus.append(wvhdu)
 
         if self.co_is_set:
             if select:
@@ -1189,22 +1246,25 @@ class XSpectrum1D(object):
             else:
                 cohdu = fits.ImageHDU(self.data['co'].filled(fill_val))
             cohdu.name = 'CONTINUUM'
-            hdu.append(cohdu)
+            hdus.append(cohdu)
+        hdu = fits.HDUList(hdus)
 
         # Use the header of the selected spectrum
         if self.header is not None:
-            hdukeys = list(prihdu.header.keys())
-            # Append ones to avoid
-            hdukeys = hdukeys + ['BUNIT', 'COMMENT', '', 'NAXIS1', 'NAXIS2', 'HISTORY']
-            for key in self.header.keys():
-                # Use new ones
-                if key in hdukeys:
-                    continue
-                # Update unused ones
-                try:
-                    prihdu.header[key] = self.header[key]
-                except ValueError:
-                    raise ValueError('l.spectra.utils: Bad header key card')
+            # Keys to avoid
+            hdukeys = frozenset(list(prihdu.header.keys()) +
+                                ['BUNIT', 'COMMENT', '', 'NAXIS1', 'NAXIS2', 'HISTORY'])
+            # Bulk copy -- one extend instead of a header write per key
+            try:
+                cards = [card for card in self.header.cards
+                         if card.keyword not in hdukeys]
+            except AttributeError:  # dict-like header
+                cards = [(key, self.header[key]) for key in self.header.keys()
+                         if key not in hdukeys]
+            try:
+                prihdu.header.extend(cards)
+            except ValueError:
+                raise ValueError('l.spectra.utils: Bad header key card')
             # History
             if 'HISTORY' in self.header.keys():
                 # Strip \n